@@ -3,17 +3,58 @@
 """
 
 import datetime
+import heapq
 import re
-from collections.abc import Iterator
-from typing import ClassVar, Optional, Union
+from collections.abc import Iterable, Iterator
+from typing import Any, ClassVar, Optional, Union
 
 import dateutil.parser
 import dateutil.relativedelta as rdelta
+import dateutil.tz
 import typepy
 
 
 DEFAULT_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
+_DEFAULT_RANGE_SEPARATOR = r"\s+\-\s+"
+_DEFAULT_RANGE_SEP_RE = re.compile(_DEFAULT_RANGE_SEPARATOR)
+
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(?:([+-])(\d{2}):?([0-5]\d))?", re.ASCII
+)
+
+# UTC offsets (in minutes) that the ISO fast path handles itself: typepy converts strings with
+# these offsets to plain fixed-offset datetimes.  Other offsets (e.g. -05:00) may be mapped to
+# DST-aware timezones by typepy, so such strings are always left to typepy.
+_FAST_PATH_UTC_OFFSETS = frozenset(
+    [
+        -11 * 60,
+        -2 * 60,
+        -1 * 60,
+        1 * 60,
+        3 * 60,
+        3 * 60 + 30,
+        4 * 60,
+        4 * 60 + 30,
+        5 * 60,
+        5 * 60 + 30,
+        5 * 60 + 45,
+        6 * 60,
+        6 * 60 + 30,
+        7 * 60,
+        8 * 60,
+        9 * 60,
+        9 * 60 + 30,
+        10 * 60,
+        10 * 60 + 30,
+        11 * 60,
+        12 * 60,
+        12 * 60 + 45,
+        13 * 60,
+        14 * 60,
+    ]
+)
+
 
 def _to_norm_relativedelta(td: Union[datetime.timedelta, rdelta.relativedelta]) -> rdelta.relativedelta:
     if isinstance(td, rdelta.relativedelta):
@@ -65,22 +106,107 @@ def _compare_timedelta(lhs: Union[datetime.timedelta, rdelta.relativedelta], sec
     return _compare_relativedelta(_to_norm_relativedelta(lhs), rdelta.relativedelta(seconds=seconds))
 
 
+def _split_range_text(range_text: str, separator: str) -> list[str]:
+    if separator == _DEFAULT_RANGE_SEPARATOR:
+        # fast path for the common "<start> - <end>" form. fall back to the regex if the
+        # text may have other matches of the separator: whitespace runs around the
+        # hyphen, or a standalone hyphen within either side.
+        parts = range_text.split(" - ")
+        if (
+            len(parts) == 2
+            and not parts[0][-1:].isspace()
+            and not parts[1][:1].isspace()
+            and "-" not in parts[0].split()
+            and "-" not in parts[1].split()
+        ):
+            return parts
+
+        return _DEFAULT_RANGE_SEP_RE.split(range_text)
+
+    # custom separators are compiled and cached by the re module itself
+    return re.split(separator, range_text)
+
+
+def _parse_iso_datetime(value: str) -> Optional[datetime.datetime]:
+    """
+    Parse ISO 8601 like datetime strings (``YYYY-MM-DD[T ]HH:MM:SS[.ffffff][+HH:MM]``)
+    without going through typepy/dateutil.
+    Return |None| for strings that the fast path can not convert identically to
+    :py:func:`_normalize_datetime_value`: the caller falls back to the generic conversion.
+    """
+
+    match = _ISO_DATETIME_RE.fullmatch(value)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, sign, offset_hour, offset_minute = match.groups()
+
+    tzinfo: Optional[datetime.tzinfo] = None
+    if sign:
+        offset_min = (int(offset_hour) * 60 + int(offset_minute)) * (-1 if sign == "-" else 1)
+        if offset_min not in _FAST_PATH_UTC_OFFSETS:
+            # zero offsets resolve to tzlocal() or tzutc() depending on the host timezone,
+            # and offsets outside the allow-list may resolve to DST-aware timezones in typepy
+            return None
+        # same tzinfo type as dateutil.parser produces for a numeric UTC offset
+        tzinfo = dateutil.tz.tzoffset(None, offset_min * 60)
+
+    try:
+        return datetime.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")[:6]) if fraction else 0,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+
+
 def _normalize_datetime_value(
     value: Union[datetime.datetime, str, None], timezone: Optional[datetime.tzinfo]
 ) -> Optional[datetime.datetime]:
     if value is None:
         return None
 
+    if timezone is None and isinstance(value, str):
+        parsed = _parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed
+
     try:
         return typepy.type.DateTime(value, strict_level=typepy.StrictLevel.MIN, timezone=timezone).convert()
     except typepy.TypeConversionError as e:
         raise ValueError(e)
 
 
+def _normalize_shifted_datetime(value: datetime.datetime, timezone: Optional[datetime.tzinfo]) -> datetime.datetime:
+    """
+    Equivalent to ``_normalize_datetime_value(value, timezone)`` for the result of
+    datetime arithmetic, without going through the typepy type dispatch.
+    """
+
+    if not isinstance(value, datetime.datetime) or (value.tzinfo is None and timezone is not None):
+        normalized = _normalize_datetime_value(value, timezone)
+        assert normalized
+        return normalized
+
+    if timezone is None:
+        return value
+
+    return datetime.datetime.fromtimestamp(value.timestamp(), tz=timezone)
+
+
 class DateTimeRange:
     """
     A class that represents a range of datetime.
 
+    Instances use ``__slots__``: they have no ``__dict__``, and assigning an
+    attribute that is not documented here raises :py:class:`AttributeError`.
+
     :param Union[datetime.datetime, str, None] start_datetime: |param_start_datetime|
     :param Union[datetime.datetime, str, None] end_datetime: |param_end_datetime|
     :param Optional[str] start_time_format:
@@ -121,6 +247,18 @@ class DateTimeRange:
 
     NOT_A_TIME_STR: ClassVar[str] = "NaT"
 
+    __slots__ = (
+        "__end_datetime",
+        "__start_datetime",
+        "__timedelta_cache",
+        "__timezone_cache",
+        "__weakref__",
+        "end_time_format",
+        "is_output_elapse",
+        "separator",
+        "start_time_format",
+    )
+
     def __init__(
         self,
         start_datetime: Union[datetime.datetime, str, None] = None,
@@ -129,6 +267,8 @@ class DateTimeRange:
         end_time_format: Optional[str] = None,
         timezone: Optional[datetime.tzinfo] = None,
     ) -> None:
+        self.__timezone_cache: Optional[tuple[Optional[datetime.tzinfo]]] = None
+        self.__timedelta_cache: Optional[datetime.timedelta] = None
         self.set_time_range(start_datetime, end_datetime, timezone)
 
         self.start_time_format = start_time_format or DEFAULT_TIME_FORMAT
@@ -137,6 +277,21 @@ class DateTimeRange:
         self.is_output_elapse = False
         self.separator = " - "
 
+    def __setstate__(
+        self, state: Union[dict[str, Any], tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]]
+    ) -> None:
+        # accepts both the slot state of pickles/copies of this version and the ``__dict__`` state of
+        # pickles created by versions without ``__slots__`` (keys such as "_DateTimeRange__start_datetime")
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self.__timezone_cache = None
+        self.__timedelta_cache = None
+
     def __repr__(self) -> str:
         if self.is_output_elapse and self.end_datetime and self.start_datetime:
             suffix = f" ({self.end_datetime - self.start_datetime})"
@@ -149,13 +304,13 @@ class DateTimeRange:
         if not isinstance(other, DateTimeRange):
             return False
 
-        return all([self.start_datetime == other.start_datetime, self.end_datetime == other.end_datetime])
+        return self.__start_datetime == other.__start_datetime and self.__end_datetime == other.__end_datetime
 
     def __ne__(self, other: object) -> bool:
         if not isinstance(other, DateTimeRange):
             return True
 
-        return any([self.start_datetime != other.start_datetime, self.end_datetime != other.end_datetime])
+        return self.__start_datetime != other.__start_datetime or self.__end_datetime != other.__end_datetime
 
     def __add__(self, other: Union[datetime.timedelta, rdelta.relativedelta]) -> "DateTimeRange":
         if self.start_datetime is None and self.end_datetime is None:
@@ -163,13 +318,13 @@ class DateTimeRange:
 
         start_datetime = self.start_datetime
         if start_datetime:
-            start_datetime += other
+            start_datetime = start_datetime + other
 
         end_datetime = self.end_datetime
         if end_datetime:
-            end_datetime += other
+            end_datetime = end_datetime + other
 
-        return DateTimeRange(start_datetime, end_datetime)
+        return DateTimeRange._from_normalized(start_datetime, end_datetime)
 
     def __iadd__(self, other: Union[datetime.timedelta, rdelta.relativedelta]) -> "DateTimeRange":
         if self.start_datetime is None and self.end_datetime is None:
@@ -178,10 +333,10 @@ class DateTimeRange:
         timezone = self.timezone
 
         if self.start_datetime:
-            self.set_start_datetime(self.start_datetime + other, timezone)
+            self._assign_start(_normalize_shifted_datetime(self.start_datetime + other, timezone))
 
         if self.end_datetime:
-            self.set_end_datetime(self.end_datetime + other, timezone)
+            self._assign_end(_normalize_shifted_datetime(self.end_datetime + other, timezone))
 
         return self
 
@@ -191,13 +346,13 @@ class DateTimeRange:
 
         start_datetime = self.start_datetime
         if start_datetime:
-            start_datetime -= other
+            start_datetime = start_datetime - other
 
         end_datetime = self.end_datetime
         if end_datetime:
-            end_datetime -= other
+            end_datetime = end_datetime - other
 
-        return DateTimeRange(start_datetime, end_datetime)
+        return DateTimeRange._from_normalized(start_datetime, end_datetime)
 
     def __isub__(self, other: Union[datetime.timedelta, rdelta.relativedelta]) -> "DateTimeRange":
         if self.start_datetime is None and self.end_datetime is None:
@@ -206,10 +361,10 @@ class DateTimeRange:
         timezone = self.timezone
 
         if self.start_datetime:
-            self.set_start_datetime(self.start_datetime - other, timezone)
+            self._assign_start(_normalize_shifted_datetime(self.start_datetime - other, timezone))
 
         if self.end_datetime:
-            self.set_end_datetime(self.end_datetime - other, timezone)
+            self._assign_end(_normalize_shifted_datetime(self.end_datetime - other, timezone))
 
         return self
 
@@ -306,13 +461,18 @@ class DateTimeRange:
         :rtype: Optional[datetime.tzinfo]
         """
 
-        if self.start_datetime and self.start_datetime.tzinfo:
-            return self.start_datetime.tzinfo
+        if self.__timezone_cache is not None:
+            return self.__timezone_cache[0]
 
-        if self.end_datetime and self.end_datetime.tzinfo:
-            return self.end_datetime.tzinfo
+        timezone = None
+        if self.__start_datetime and self.__start_datetime.tzinfo:
+            timezone = self.__start_datetime.tzinfo
+        elif self.__end_datetime and self.__end_datetime.tzinfo:
+            timezone = self.__end_datetime.tzinfo
 
-        return None
+        self.__timezone_cache = (timezone,)
+
+        return timezone
 
     @property
     def timedelta(self) -> datetime.timedelta:
@@ -333,12 +493,17 @@ class DateTimeRange:
                 datetime.timedelta(0, 600)
         """
 
+        if self.__timedelta_cache is not None:
+            return self.__timedelta_cache
+
         if self.start_datetime is None:
             raise TypeError("Must set start_datetime")
         if self.end_datetime is None:
             raise TypeError("Must set end_datetime")
 
-        return self.end_datetime - self.start_datetime
+        self.__timedelta_cache = self.end_datetime - self.start_datetime
+
+        return self.__timedelta_cache
 
     def is_set(self) -> bool:
         """
@@ -364,7 +529,7 @@ class DateTimeRange:
                 True
         """
 
-        return all([self.start_datetime is not None, self.end_datetime is not None])
+        return self.__start_datetime is not None and self.__end_datetime is not None
 
     def is_time_inversion(self, allow_timezone_mismatch: bool = True) -> bool:
         """
@@ -435,6 +600,19 @@ class DateTimeRange:
         if start_utc > end_utc:
             raise ValueError(f"time inversion found: {str(self.start_datetime):s} > {str(self.end_datetime):s}")
 
+    def _is_valid_fast(self) -> bool:
+        # non-raising counterpart of validate_time_inversion() with the default arguments
+        start = self.__start_datetime
+        end = self.__end_datetime
+        if start is None or end is None:
+            return False
+
+        try:
+            # converting naive datetimes near datetime.min/max can overflow
+            return start.astimezone(datetime.timezone.utc) <= end.astimezone(datetime.timezone.utc)
+        except (TypeError, ValueError):
+            return False
+
     def is_valid_timerange(self) -> bool:
         """
         :return:
@@ -464,12 +642,7 @@ class DateTimeRange:
             :py:meth:`.validate_time_inversion`
         """
 
-        try:
-            self.validate_time_inversion()
-        except (TypeError, ValueError):
-            return False
-
-        return self.is_set()
+        return self._is_valid_fast()
 
     def is_intersection(
         self,
@@ -606,7 +779,7 @@ class DateTimeRange:
                 2015-03-22T10:00:00+0900 - NaT
         """
 
-        self.__start_datetime = _normalize_datetime_value(value, timezone)
+        self._assign_start(_normalize_datetime_value(value, timezone))
 
     def set_end_datetime(
         self, value: Union[datetime.datetime, str, None], timezone: Optional[datetime.tzinfo] = None
@@ -633,7 +806,19 @@ class DateTimeRange:
                 NaT - 2015-03-22T10:10:00+0900
         """
 
-        self.__end_datetime = _normalize_datetime_value(value, timezone)
+        self._assign_end(_normalize_datetime_value(value, timezone))
+
+    def _assign_start(self, value: Optional[datetime.datetime]) -> None:
+        # assign an already normalized value
+        self.__start_datetime = value
+        self.__timezone_cache = None
+        self.__timedelta_cache = None
+
+    def _assign_end(self, value: Optional[datetime.datetime]) -> None:
+        # assign an already normalized value
+        self.__end_datetime = value
+        self.__timezone_cache = None
+        self.__timedelta_cache = None
 
     def set_time_range(
         self,
@@ -756,7 +941,12 @@ class DateTimeRange:
         assert x.start_datetime
         assert x.end_datetime
 
-        if any([x.start_datetime in self, self.start_datetime in x]):
+        # both ranges are already validated: compare the datetimes directly instead of
+        # using the "in" operator, which validates the ranges again
+        if (
+            self.start_datetime <= x.start_datetime <= self.end_datetime
+            or x.start_datetime <= self.start_datetime <= x.end_datetime
+        ):
             start_datetime = max(self.start_datetime, x.start_datetime)
             end_datetime = min(self.end_datetime, x.end_datetime)
         else:
@@ -765,7 +955,7 @@ class DateTimeRange:
 
         if intersection_threshold is not None:
             if start_datetime is None or end_datetime is None:
-                return DateTimeRange(
+                return DateTimeRange._from_normalized(
                     start_datetime=None,
                     end_datetime=None,
                     start_time_format=self.start_time_format,
@@ -784,7 +974,7 @@ class DateTimeRange:
                 start_datetime = None
                 end_datetime = None
 
-        return DateTimeRange(
+        return DateTimeRange._from_normalized(
             start_datetime=start_datetime,
             end_datetime=end_datetime,
             start_time_format=self.start_time_format,
@@ -821,7 +1011,7 @@ class DateTimeRange:
         # No intersection, return a copy of the original
         if not overlap.is_set() or overlap.get_timedelta_second() <= 0:
             return [
-                DateTimeRange(
+                DateTimeRange._from_normalized(
                     start_datetime=self.start_datetime,
                     end_datetime=self.end_datetime,
                     start_time_format=self.start_time_format,
@@ -836,7 +1026,7 @@ class DateTimeRange:
         # Case 3, overlap on start
         if overlap.start_datetime == self.start_datetime:
             return [
-                DateTimeRange(
+                DateTimeRange._from_normalized(
                     start_datetime=overlap.end_datetime,
                     end_datetime=self.end_datetime,
                     start_time_format=self.start_time_format,
@@ -847,7 +1037,7 @@ class DateTimeRange:
         # Case 4, overlap on end
         if overlap.end_datetime == self.end_datetime:
             return [
-                DateTimeRange(
+                DateTimeRange._from_normalized(
                     start_datetime=self.start_datetime,
                     end_datetime=overlap.start_datetime,
                     start_time_format=self.start_time_format,
@@ -857,13 +1047,13 @@ class DateTimeRange:
 
         # Case 5, underlap, two new ranges are needed.
         return [
-            DateTimeRange(
+            DateTimeRange._from_normalized(
                 start_datetime=self.start_datetime,
                 end_datetime=overlap.start_datetime,
                 start_time_format=self.start_time_format,
                 end_time_format=self.end_time_format,
             ),
-            DateTimeRange(
+            DateTimeRange._from_normalized(
                 start_datetime=overlap.end_datetime,
                 end_datetime=self.end_datetime,
                 start_time_format=self.start_time_format,
@@ -898,13 +1088,88 @@ class DateTimeRange:
         assert x.start_datetime
         assert x.end_datetime
 
-        return DateTimeRange(
+        return DateTimeRange._from_normalized(
             start_datetime=min(self.start_datetime, x.start_datetime),
             end_datetime=max(self.end_datetime, x.end_datetime),
             start_time_format=self.start_time_format,
             end_time_format=self.end_time_format,
         )
 
+    @classmethod
+    def intersect_many(
+        cls, lhs_ranges: Iterable["DateTimeRange"], rhs_ranges: Iterable["DateTimeRange"]
+    ) -> list["DateTimeRange"]:
+        """
+        Create time ranges that overlap between any of ``lhs_ranges`` and any of ``rhs_ranges``.
+        The result is the same as calling :py:meth:`.intersection` for every pair of the ranges
+        and collecting the results that are set, without comparing all of the pairs.
+
+        :param Iterable[DateTimeRange] lhs_ranges:
+            Time ranges to compute intersections with ``rhs_ranges``.
+        :param Iterable[DateTimeRange] rhs_ranges:
+            Time ranges to compute intersections with ``lhs_ranges``.
+        :return: List(DateTimeRange)
+            Intersected time ranges in ascending order of the start time.
+            Time formats of the results are taken from the ranges of ``lhs_ranges``.
+
+        :Sample Code:
+            .. code:: python
+
+                from datetimerange import DateTimeRange
+                lhs = [
+                    DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
+                    DateTimeRange("2015-03-22T10:20:00+0900", "2015-03-22T10:30:00+0900"),
+                ]
+                rhs = [DateTimeRange("2015-03-22T10:05:00+0900", "2015-03-22T10:25:00+0900")]
+                for value in DateTimeRange.intersect_many(lhs, rhs):
+                    print(value)
+        :Output:
+            .. parsed-literal::
+
+                2015-03-22T10:05:00+0900 - 2015-03-22T10:10:00+0900
+                2015-03-22T10:20:00+0900 - 2015-03-22T10:25:00+0900
+
+        .. seealso::
+            :py:meth:`.intersection`
+        """
+
+        ranges: list[tuple[datetime.datetime, datetime.datetime, int, DateTimeRange]] = []
+        for side, side_ranges in enumerate((lhs_ranges, rhs_ranges)):
+            for dtr in side_ranges:
+                dtr.validate_time_inversion()
+                assert dtr.start_datetime
+                assert dtr.end_datetime
+
+                ranges.append((dtr.start_datetime, dtr.end_datetime, side, dtr))
+
+        ranges.sort(key=lambda item: item[0])
+
+        # ranges that started so far and have not ended yet for each side:
+        # heaps of (end_datetime, order, start_datetime, range)
+        active_ranges: tuple[list, list] = ([], [])
+        results = []
+
+        for order, (start_datetime, end_datetime, side, dtr) in enumerate(ranges):
+            other_ranges = active_ranges[1 - side]
+            while other_ranges and other_ranges[0][0] < start_datetime:
+                heapq.heappop(other_ranges)
+
+            # each of the remaining ranges started before the range and ends after it started
+            for other_end_datetime, _, other_start_datetime, other in other_ranges:
+                time_format_source = dtr if side == 0 else other
+                results.append(
+                    cls._from_normalized(
+                        start_datetime=max(start_datetime, other_start_datetime),
+                        end_datetime=min(end_datetime, other_end_datetime),
+                        start_time_format=time_format_source.start_time_format,
+                        end_time_format=time_format_source.end_time_format,
+                    )
+                )
+
+            heapq.heappush(active_ranges[side], (end_datetime, order, start_datetime, dtr))
+
+        return results
+
     def truncate(self, percentage: float) -> None:
         """
         Truncate ``percentage`` / 2 [%] of the whole time from the first and last time.
@@ -936,13 +1201,15 @@ class DateTimeRange:
         if percentage == 0:
             return
 
-        discard_time = self.timedelta // int(100) * int(percentage / 2)
+        start_datetime = self.__start_datetime
+        end_datetime = self.__end_datetime
+        assert start_datetime
+        assert end_datetime
 
-        if self.__start_datetime:
-            self.__start_datetime += discard_time
+        discard_time = (end_datetime - start_datetime) // 100 * int(percentage / 2)
 
-        if self.__end_datetime:
-            self.__end_datetime -= discard_time
+        self._assign_start(start_datetime + discard_time)
+        self._assign_end(end_datetime - discard_time)
 
     def split(self, separator: Union[str, datetime.datetime]) -> list["DateTimeRange"]:
         """
@@ -968,11 +1235,18 @@ class DateTimeRange:
         self.validate_time_inversion()
 
         separatingseparation = _normalize_datetime_value(separator, timezone=None)
-        assert separatingseparation
+        if separatingseparation is None:
+            raise TypeError("separator cannot be None")
+
+        start_datetime = self.__start_datetime
+        end_datetime = self.__end_datetime
+        assert start_datetime
+        assert end_datetime
 
-        if (separatingseparation not in self) or (separatingseparation in (self.start_datetime, self.end_datetime)):
+        # the range is not split if the separator is out of the range or at its edges
+        if separatingseparation <= start_datetime or separatingseparation >= end_datetime:
             return [
-                DateTimeRange(
+                DateTimeRange._from_normalized(
                     start_datetime=self.start_datetime,
                     end_datetime=self.end_datetime,
                     start_time_format=self.start_time_format,
@@ -981,13 +1255,13 @@ class DateTimeRange:
             ]
 
         return [
-            DateTimeRange(
+            DateTimeRange._from_normalized(
                 start_datetime=self.start_datetime,
                 end_datetime=separatingseparation,
                 start_time_format=self.start_time_format,
                 end_time_format=self.end_time_format,
             ),
-            DateTimeRange(
+            DateTimeRange._from_normalized(
                 start_datetime=separatingseparation,
                 end_datetime=self.end_datetime,
                 start_time_format=self.start_time_format,
@@ -995,11 +1269,31 @@ class DateTimeRange:
             ),
         ]
 
+    @classmethod
+    def _from_normalized(
+        cls,
+        start_datetime: Optional[datetime.datetime],
+        end_datetime: Optional[datetime.datetime],
+        start_time_format: Optional[str] = None,
+        end_time_format: Optional[str] = None,
+    ) -> "DateTimeRange":
+        # same as the constructor with timezone=None for already normalized datetime values,
+        # without passing the values to the normalization again
+        dtr = cls.__new__(cls)
+        dtr._assign_start(start_datetime)
+        dtr._assign_end(end_datetime)
+        dtr.start_time_format = start_time_format or DEFAULT_TIME_FORMAT
+        dtr.end_time_format = end_time_format or DEFAULT_TIME_FORMAT
+        dtr.is_output_elapse = False
+        dtr.separator = " - "
+
+        return dtr
+
     @classmethod
     def from_range_text(
         cls,
         range_text: str,
-        separator: str = r"\s+\-\s+",
+        separator: str = _DEFAULT_RANGE_SEPARATOR,
         start_time_format: Optional[str] = None,
         end_time_format: Optional[str] = None,
         timezone: Optional[datetime.tzinfo] = None,
@@ -1017,7 +1311,7 @@ class DateTimeRange:
             Created instance.
         """
 
-        datetime_ranges = re.split(separator, range_text.strip())
+        datetime_ranges = _split_range_text(range_text.strip(), separator)
         if len(datetime_ranges) != 2:
             raise ValueError(f"range_text should include two datetime that separated by hyphen: got={datetime_ranges}")
 
@@ -27,6 +27,7 @@ def write_examples(maker):
         "Test_whether_a_value_within_the_time_range.rst",
         "Test_whether_a_value_intersect_the_time_range.rst",
         "Make_an_intersected_time_range.rst",
+        "Make_intersected_time_ranges_of_multiple_time_ranges.rst",
         "Make_an_encompassed_time_range.rst",
         "Truncate_time_range.rst",
     ]
@@ -24,23 +24,23 @@ def get_release_command_class() -> dict[str, type[setuptools.Command]]:
     return {"release": ReleaseCommand}
 
 
-with open(os.path.join(MODULE_NAME.lower(), "__version__.py")) as f:
-    exec(f.read(), pkg_info)
+def read_text(path: str) -> str:
+    with open(path, encoding=ENCODING) as f:
+        return f.read()
 
-with open("README.rst", encoding=ENCODING) as fp:
-    long_description = fp.read()
 
-with open(os.path.join("docs", "pages", "introduction", "summary.txt"), encoding=ENCODING) as f:
-    summary = f.read().strip()
+def read_requirements(filename: str) -> list[str]:
+    return [line.strip() for line in read_text(os.path.join(REQUIREMENT_DIR, filename)).splitlines() if line.strip()]
 
-with open(os.path.join(REQUIREMENT_DIR, "requirements.txt")) as f:
-    install_requires = [line.strip() for line in f if line.strip()]
 
-with open(os.path.join(REQUIREMENT_DIR, "test_requirements.txt")) as f:
-    tests_requires = [line.strip() for line in f if line.strip()]
+exec(read_text(os.path.join(MODULE_NAME.lower(), "__version__.py")), pkg_info)
 
-with open(os.path.join(REQUIREMENT_DIR, "docs_requirements.txt")) as f:
-    docs_requires = [line.strip() for line in f if line.strip()]
+long_description = read_text("README.rst")
+summary = read_text(os.path.join("docs", "pages", "introduction", "summary.txt")).strip()
+
+install_requires = read_requirements("requirements.txt")
+tests_requires = read_requirements("test_requirements.txt")
+docs_requires = read_requirements("docs_requirements.txt")
 
 setuptools.setup(
     name=MODULE_NAME,
@@ -2,35 +2,54 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import pickle
+import weakref
 from copy import deepcopy
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 import pytz
-from dateutil.parser import parse
+import typepy
 from dateutil.relativedelta import relativedelta
 
 from datetimerange import DateTimeRange
-from datetimerange._core import _normalize_datetime_value
+from datetimerange._core import _FAST_PATH_UTC_OFFSETS, _normalize_datetime_value
 
 
 TIMEZONE = "+0900"
 START_DATETIME_TEXT = "2015-03-22T10:00:00" + TIMEZONE
 END_DATETIME_TEXT = "2015-03-22T10:10:00" + TIMEZONE
-
-TEST_START_DATETIME = parse(START_DATETIME_TEXT)
-TEST_END_DATETIME = parse(END_DATETIME_TEXT)
 ISO_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
 
+JST = timezone(timedelta(hours=9))
+TZ_TOKYO = pytz.timezone("Asia/Tokyo")
+
+# same instants as START_DATETIME_TEXT/END_DATETIME_TEXT, built without parsing the strings
+TEST_START_DATETIME = datetime(2015, 3, 22, 10, 0, tzinfo=JST)
+TEST_END_DATETIME = datetime(2015, 3, 22, 10, 10, tzinfo=JST)
+
+_TD_10M = timedelta(minutes=10)
+_TD_10M_NEG = -_TD_10M
+_TD_ZERO = timedelta(0)
+_RD_10M = relativedelta(minutes=+10)
+_RD_6H = relativedelta(hours=+6)
+_RD_4MO = relativedelta(months=+4)
+
+
 def setup_module(module):
     import locale
 
-    locale.setlocale(locale.LC_ALL, ("C", "ascii"))
+    if locale.setlocale(locale.LC_ALL) in ("C", "C.UTF-8", "POSIX"):
+        return
 
+    try:
+        locale.setlocale(locale.LC_ALL, ("C", "ascii"))
+    except locale.Error:
+        pass
 
-@pytest.fixture
-def datetimerange_normal():
+
+def _datetimerange_normal() -> DateTimeRange:
     return DateTimeRange(
         TEST_START_DATETIME,
         TEST_END_DATETIME,
@@ -39,8 +58,7 @@ def datetimerange_normal():
     )
 
 
-@pytest.fixture
-def datetimerange_inversion():
+def _datetimerange_inversion() -> DateTimeRange:
     return DateTimeRange(
         TEST_END_DATETIME,
         TEST_START_DATETIME,
@@ -49,8 +67,7 @@ def datetimerange_inversion():
     )
 
 
-@pytest.fixture
-def datetimerange_null():
+def _datetimerange_null() -> DateTimeRange:
     return DateTimeRange(
         None,
         None,
@@ -59,8 +76,7 @@ def datetimerange_null():
     )
 
 
-@pytest.fixture
-def datetimerange_null_start():
+def _datetimerange_null_start() -> DateTimeRange:
     return DateTimeRange(
         None,
         TEST_END_DATETIME,
@@ -69,6 +85,64 @@ def datetimerange_null_start():
     )
 
 
+def _datetimerange_null_end() -> DateTimeRange:
+    return DateTimeRange(TEST_START_DATETIME, None)
+
+
+def _binary_exc_cases() -> list:
+    # operands that binary operations (is_intersection, subtract, intersection, encompass) reject
+    return [
+        [_datetimerange_null(), _datetimerange_null(), TypeError],
+        [_datetimerange_null_start(), _datetimerange_normal(), TypeError],
+        [_datetimerange_inversion(), _datetimerange_normal(), ValueError],
+        [_datetimerange_normal(), _datetimerange_null_start(), TypeError],
+        [_datetimerange_normal(), _datetimerange_inversion(), ValueError],
+    ]
+
+
+def _snapshot(dtr: DateTimeRange) -> tuple:
+    # the attributes that a non-mutating operation must leave unchanged
+    return (dtr.start_datetime, dtr.end_datetime, dtr.start_time_format, dtr.end_time_format)
+
+
+def _to_dt(minute: int) -> datetime:
+    return datetime(2015, 1, 22, 10, minute, tzinfo=JST)
+
+
+# canonical relations of two ranges, endpoints are minutes mapped by _to_dt
+_SWEEP_CASES = [
+    pytest.param((0, 1), (2, 3), id="disjoint_left"),
+    pytest.param((0, 1), (1, 2), id="touching_left"),
+    pytest.param((0, 2), (1, 3), id="overlap_left"),
+    pytest.param((1, 2), (0, 3), id="contained"),
+    pytest.param((0, 1), (0, 1), id="equal"),
+    pytest.param((0, 3), (1, 2), id="containing"),
+    pytest.param((1, 3), (0, 2), id="overlap_right"),
+    pytest.param((1, 2), (0, 1), id="touching_right"),
+    pytest.param((2, 3), (0, 1), id="disjoint_right"),
+]
+
+
+@pytest.fixture
+def datetimerange_normal():
+    return _datetimerange_normal()
+
+
+@pytest.fixture
+def datetimerange_inversion():
+    return _datetimerange_inversion()
+
+
+@pytest.fixture
+def datetimerange_null():
+    return _datetimerange_null()
+
+
+@pytest.fixture
+def datetimerange_null_start():
+    return _datetimerange_null_start()
+
+
 class TestDateTimeRange_repr:
     @pytest.mark.parametrize(
         ["start", "start_format", "end", "end_format", "separator", "is_output_elapse", "expected"],
@@ -80,7 +154,7 @@ class TestDateTimeRange_repr:
                 ISO_TIME_FORMAT,
                 " - ",
                 False,
-                "2015-03-22T10:00:00+0900 - 2015-03-22T10:10:00+0900",
+                f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT}",
             ],
             [
                 TEST_START_DATETIME,
@@ -89,7 +163,7 @@ class TestDateTimeRange_repr:
                 None,
                 " - ",
                 False,
-                "2015-03-22T10:00:00+0900 - 2015-03-22T10:10:00+0900",
+                f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT}",
             ],
             [
                 "2015-03-22T09:00:00+0900",
@@ -116,7 +190,7 @@ class TestDateTimeRange_repr:
                 ISO_TIME_FORMAT,
                 " - ",
                 True,
-                "2015-03-22T10:00:00+0900 - 2015-03-22T10:10:00+0900 (0:10:00)",
+                f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT} (0:10:00)",
             ],
             [
                 TEST_END_DATETIME,
@@ -125,7 +199,7 @@ class TestDateTimeRange_repr:
                 ISO_TIME_FORMAT,
                 " - ",
                 True,
-                "2015-03-22T10:10:00+0900 - 2015-03-22T10:00:00+0900 (-1 day, 23:50:00)",
+                f"{END_DATETIME_TEXT} - {START_DATETIME_TEXT} (-1 day, 23:50:00)",
             ],
             [
                 TEST_START_DATETIME,
@@ -143,7 +217,7 @@ class TestDateTimeRange_repr:
                 ISO_TIME_FORMAT,
                 " - ",
                 False,
-                "NaT - 2015-03-22T10:10:00+0900",
+                f"NaT - {END_DATETIME_TEXT}",
             ],
             [
                 TEST_START_DATETIME,
@@ -152,7 +226,7 @@ class TestDateTimeRange_repr:
                 ISO_TIME_FORMAT,
                 " - ",
                 False,
-                "2015-03-22T10:00:00+0900 - NaT",
+                f"{START_DATETIME_TEXT} - NaT",
             ],
             [
                 "2015-03-22",
@@ -231,76 +305,105 @@ class TestDateTimeRange_eq:
     @pytest.mark.parametrize(
         ["lhs", "rhs", "expected"],
         [
-            [DateTimeRange(None, None), DateTimeRange(None, None), True],
+            [_datetimerange_null(), DateTimeRange(None, None), True],
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
                 True,
             ],
             [
-                DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
-                DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, 0), datetime(2015, 3, 22, 10, 10, 0)),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, 0), datetime(2015, 3, 22, 10, 10, 0)),
                 True,
             ],
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:20:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 False,
             ],
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:02:00+0900", "2015-03-22T10:10:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 3, 22, 10, 2, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
                 False,
             ],
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T11:00:00+0900", "2015-03-22T12:10:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 3, 22, 11, 0, tzinfo=JST), datetime(2015, 3, 22, 12, 10, tzinfo=JST)),
                 False,
             ],
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), None, False],
-            [None, DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), False],
+            [_datetimerange_normal(), None, False],
+            [None, _datetimerange_normal(), False],
         ],
     )
     def test_normal(self, lhs, rhs, expected):
         assert (lhs == rhs) == expected
+        assert (lhs != rhs) == (not expected)
+
+
+# DateTimeRange instances pickled by datetimerange 2.3.1 (before __slots__ were defined)
+_PICKLE_V2_3_1_NORMAL = (
+    b"\x80\x02cdatetimerange._core\nDateTimeRange\nq\x00)\x81q\x01}q\x02(X\x1e\x00\x00\x00_DateTimeRange__start_datetimeq"
+    b"\x03cdatetime\ndatetime\nq\x04c_codecs\nencode\nq\x05X\x0b\x00\x00\x00\x07\xc3\x9f\x03\x16\n\x00\x00\x00\x00\x00q"
+    b"\x06X\x06\x00\x00\x00latin1q\x07\x86q\x08Rq\tcdateutil.tz.tz\ntzoffset\nq\n)\x81q\x0b}q\x0c(X\x05\x00\x00\x00_nameq"
+    b"\rNX\x07\x00\x00\x00_offsetq\x0ecdatetime\ntimedelta\nq\x0fK\x00M\x90~K\x00\x87q\x10Rq\x11ub\x86q\x12Rq\x13X\x1c"
+    b"\x00\x00\x00_DateTimeRange__end_datetimeq\x14h\x04h\x05X\x0b\x00\x00\x00\x07\xc3\x9f\x03\x16\n\n\x00\x00\x00\x00q"
+    b"\x15h\x07\x86q\x16Rq\x17h\x0b\x86q\x18Rq\x19X\x11\x00\x00\x00start_time_formatq\x1aX\x13\x00\x00\x00%Y-%m-%dT%H:"
+    b"%M:%S%zq\x1bX\x0f\x00\x00\x00end_time_formatq\x1ch\x1bX\x10\x00\x00\x00is_output_elapseq\x1d\x88X\t\x00\x00\x00"
+    b"separatorq\x1eX\x03\x00\x00\x00 - q\x1fub."
+)
+_PICKLE_V2_3_1_NULL = (
+    b"\x80\x02cdatetimerange._core\nDateTimeRange\nq\x00)\x81q\x01}q\x02(X\x1e\x00\x00\x00_DateTimeRange__start_datetimeq"
+    b"\x03NX\x1c\x00\x00\x00_DateTimeRange__end_datetimeq\x04NX\x11\x00\x00\x00start_time_formatq\x05X\x13\x00\x00\x00"
+    b"%Y-%m-%dT%H:%M:%S%zq\x06X\x0f\x00\x00\x00end_time_formatq\x07h\x06X\x10\x00\x00\x00is_output_elapseq\x08\x89X\t"
+    b"\x00\x00\x00separatorq\tX\x03\x00\x00\x00 - q\nub."
+)
+
+
+class TestDateTimeRange_slots:
+    def test_normal(self, datetimerange_normal):
+        datetimerange_normal.is_output_elapse = True
+        datetimerange_normal.separator = " to "
+        dtr = deepcopy(datetimerange_normal)
+
+        assert dtr == datetimerange_normal
+        assert dtr.timezone == datetimerange_normal.timezone
+        assert str(dtr) == "2015-03-22T10:00:00+0900 to 2015-03-22T10:10:00+0900 (0:10:00)"
+
+    def test_weakref(self, datetimerange_normal):
+        assert weakref.ref(datetimerange_normal)() is datetimerange_normal
+
+    def test_normal_pickle(self, datetimerange_normal):
+        datetimerange_normal.is_output_elapse = True
+        dtr = pickle.loads(pickle.dumps(datetimerange_normal))
 
+        assert dtr == datetimerange_normal
+        assert dtr.timezone == datetimerange_normal.timezone
+        assert str(dtr) == str(datetimerange_normal)
 
-class TestDateTimeRange_neq:
     @pytest.mark.parametrize(
-        ["lhs", "rhs", "expected"],
+        ["value", "expected_str", "expected_utcoffset"],
         [
-            [DateTimeRange(None, None), DateTimeRange(None, None), False],
-            [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                False,
-            ],
-            [
-                DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
-                DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
-                False,
-            ],
-            [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:20:00+0900"),
-                True,
-            ],
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T10:02:00+0900", "2015-03-22T10:10:00+0900"),
-                True,
-            ],
-            [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-22T11:00:00+0900", "2015-03-22T12:10:00+0900"),
-                True,
+                _PICKLE_V2_3_1_NORMAL,
+                "2015-03-22T10:00:00+0900 - 2015-03-22T10:10:00+0900 (0:10:00)",
+                timedelta(hours=9),
             ],
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), None, True],
-            [None, DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), True],
+            [_PICKLE_V2_3_1_NULL, "NaT - NaT", None],
         ],
+        ids=["normal", "null"],
     )
-    def test_normal(self, lhs, rhs, expected):
-        assert (lhs != rhs) == expected
+    def test_normal_pickle_v2_3_1(self, value, expected_str, expected_utcoffset):
+        dtr = pickle.loads(value)
+
+        assert str(dtr) == expected_str
+        assert (dtr.timezone and dtr.timezone.utcoffset(None)) == expected_utcoffset
+
+        dtr.set_end_datetime("2015-03-22T10:20:00+0900")
+        assert dtr.end_datetime == datetime(2015, 3, 22, 10, 20, tzinfo=JST)
+
+    def test_exception(self, datetimerange_normal):
+        with pytest.raises(AttributeError):
+            datetimerange_normal.unknown_attribute = None
 
 
 class TestDateTimeRange_add:
@@ -308,18 +411,18 @@ class TestDateTimeRange_add:
         ["value", "add_value", "expected"],
         [
             [
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                timedelta(seconds=10 * 60),
-                DateTimeRange("2015-03-22T10:10:00+0900", "2015-03-22T10:20:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                _TD_10M,
+                DateTimeRange(datetime(2015, 3, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
             ],
             [
                 DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
-                timedelta(seconds=-10 * 60),
+                _TD_10M_NEG,
                 DateTimeRange("2015-03-22T09:50:00", "2015-03-22T10:00:00"),
             ],
             [
                 DateTimeRange("2015-03-22T10:00:00", "2015-03-22T10:10:00"),
-                relativedelta(hours=+6),
+                _RD_6H,
                 DateTimeRange("2015-03-22T16:00:00", "2015-03-22T16:10:00"),
             ],
         ],
@@ -342,23 +445,30 @@ class TestDateTimeRange_add:
         with pytest.raises(TypeError):
             datetimerange_normal + value
 
-    def test_null(self, datetimerange_null):
+    def test_null(self):
         with pytest.raises(TypeError):
-            datetimerange_null + timedelta(seconds=10 * 60)
+            _datetimerange_null() + _TD_10M
 
 
 class TestDateTimeRange_iadd:
     def test_normal(self):
-        value1 = DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900")
-        value2 = DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900")
-        expected = DateTimeRange("2015-03-22T10:10:00+0900", "2015-03-22T10:20:00+0900")
+        value1 = DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST))
+        value2 = DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST))
+        expected = DateTimeRange(datetime(2015, 3, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST))
 
-        value1 += timedelta(seconds=10 * 60)
+        value1 += _TD_10M
         assert value1 == expected
 
-        value2 += relativedelta(seconds=10 * 60)
+        value2 += _RD_10M
         assert value2 == expected
 
+    def test_normal_dst(self):
+        dtr = DateTimeRange("2015-03-08T00:00:00-0500", "2015-03-08T01:00:00-0500")
+        dtr.is_output_elapse = True
+
+        dtr += timedelta(hours=1)
+        assert str(dtr) == "2015-03-08T01:00:00-0500 - 2015-03-08T03:00:00-0400 (1:00:00)"
+
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
@@ -373,19 +483,19 @@ class TestDateTimeRange_iadd:
 
     def test_null(self, datetimerange_null):
         with pytest.raises(TypeError):
-            datetimerange_null += timedelta(seconds=10 * 60)
+            datetimerange_null += _TD_10M
 
 
 class TestDateTimeRange_sub:
     def test_normal(self):
-        value = DateTimeRange("2015-03-22T10:10:00+0900", "2015-03-22T10:20:00+0900")
-        expected = DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900")
+        value = DateTimeRange(datetime(2015, 3, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST))
+        expected = DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST))
 
-        new_datetimerange = value - timedelta(seconds=10 * 60)
+        new_datetimerange = value - _TD_10M
         assert new_datetimerange == expected
         assert value != new_datetimerange
 
-        new_datetimerange = value - relativedelta(seconds=10 * 60)
+        new_datetimerange = value - _RD_10M
         assert new_datetimerange == expected
         assert value != new_datetimerange
 
@@ -401,21 +511,21 @@ class TestDateTimeRange_sub:
         with pytest.raises(TypeError):
             datetimerange_normal - value
 
-    def test_null(self, datetimerange_null):
+    def test_null(self):
         with pytest.raises(TypeError):
-            datetimerange_null - timedelta(seconds=10 * 60)
+            _datetimerange_null() - _TD_10M
 
 
 class TestDateTimeRange_isub:
     def test_normal(self):
-        value1 = DateTimeRange("2015-03-22T10:10:00+0900", "2015-03-22T10:20:00+0900")
-        value2 = DateTimeRange("2015-03-22T10:10:00+0900", "2015-03-22T10:20:00+0900")
-        expected = DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900")
+        value1 = DateTimeRange(datetime(2015, 3, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST))
+        value2 = DateTimeRange(datetime(2015, 3, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST))
+        expected = DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST))
 
-        value1 -= timedelta(seconds=10 * 60)
+        value1 -= _TD_10M
         assert value1 == expected
 
-        value2 -= relativedelta(seconds=10 * 60)
+        value2 -= _RD_10M
         assert value2 == expected
 
     @pytest.mark.parametrize(
@@ -432,7 +542,7 @@ class TestDateTimeRange_isub:
 
     def test_null(self, datetimerange_null):
         with pytest.raises(TypeError):
-            datetimerange_null -= timedelta(seconds=10 * 60)
+            datetimerange_null -= _TD_10M
 
 
 class TestDateTimeRange_contains:
@@ -444,15 +554,17 @@ class TestDateTimeRange_contains:
             [TEST_START_DATETIME, True],
             [TEST_END_DATETIME, True],
             [
-                DateTimeRange("2015-03-22 10:05:00" + TIMEZONE, "2015-03-22 10:06:00" + TIMEZONE),
+                DateTimeRange(datetime(2015, 3, 22, 10, 5, tzinfo=JST), datetime(2015, 3, 22, 10, 6, tzinfo=JST)),
                 True,
             ],
             [
-                DateTimeRange("2015-03-22 10:10:01" + TIMEZONE, "2015-03-22 10:11:01" + TIMEZONE),
+                DateTimeRange(
+                    datetime(2015, 3, 22, 10, 10, 1, tzinfo=JST), datetime(2015, 3, 22, 10, 11, 1, tzinfo=JST)
+                ),
                 False,
             ],
-            ["2015-03-22 09:59:59" + TIMEZONE, False],
-            ["2015-03-22 10:10:01" + TIMEZONE, False],
+            ["2015-03-22 09:59:59+0900", False],
+            ["2015-03-22 10:10:01+0900", False],
         ],
     )
     def test_normal(self, datetimerange_normal, value, expected):
@@ -476,7 +588,7 @@ class TestDateTimeRange_contains:
 
 class TestDateTimeRange_timedelta:
     def test_normal(self, datetimerange_normal):
-        assert datetimerange_normal.timedelta == timedelta(seconds=10 * 60)
+        assert datetimerange_normal.timedelta == _TD_10M
 
     @pytest.mark.parametrize(
         ["start", "end", "expected"],
@@ -497,27 +609,65 @@ class TestDateTimeRange_timedelta:
         dtr = DateTimeRange(start, end)
         assert dtr.timedelta == expected
 
+    def test_normal_update(self, datetimerange_normal):
+        assert datetimerange_normal.timedelta == _TD_10M
+
+        datetimerange_normal.set_end_datetime("2015-03-22T10:20:00+0900")
+        assert datetimerange_normal.timedelta == timedelta(seconds=20 * 60)
+
+        datetimerange_normal += timedelta(minutes=5)
+        assert datetimerange_normal.timedelta == timedelta(seconds=20 * 60)
+
+        datetimerange_normal.truncate(50)
+        assert datetimerange_normal.timedelta == _TD_10M
+
+        datetimerange_normal.set_start_datetime(None)
+        with pytest.raises(TypeError):
+            datetimerange_normal.timedelta
+
     def test_inversion(self, datetimerange_inversion):
-        assert datetimerange_inversion.timedelta == timedelta(-1, 85800)
+        assert datetimerange_inversion.timedelta == _TD_10M_NEG
 
-    def test_null(self, datetimerange_null):
+    def test_null(self):
         with pytest.raises(TypeError):
-            datetimerange_null.timedelta
+            _datetimerange_null().timedelta
 
     def test_exception(self, datetimerange_null_start):
         with pytest.raises(TypeError):
             datetimerange_null_start.timedelta
 
 
+class TestDateTimeRange_timezone:
+    def test_normal(self):
+        dtr = DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)
+        assert dtr.timezone == TEST_START_DATETIME.tzinfo
+
+        dtr.set_time_range(TEST_START_DATETIME, TEST_END_DATETIME, timezone=pytz.utc)
+        assert dtr.timezone == pytz.utc
+
+        dtr.set_start_datetime(None)
+        assert dtr.timezone == pytz.utc
+
+        dtr.set_end_datetime(None)
+        assert dtr.timezone is None
+
+    def test_deepcopy(self):
+        dtr = DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)
+        assert deepcopy(dtr).timezone == TEST_START_DATETIME.tzinfo
+
+        assert dtr.timezone == TEST_START_DATETIME.tzinfo
+        assert deepcopy(dtr).timezone == TEST_START_DATETIME.tzinfo
+
+
 class TestDateTimeRange_is_set:
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), True],
-            [DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME), True],
-            [DateTimeRange(TEST_START_DATETIME, None), False],
+            [_datetimerange_normal(), True],
+            [_datetimerange_inversion(), True],
+            [_datetimerange_null_end(), False],
             [DateTimeRange(None, TEST_START_DATETIME), False],
-            [DateTimeRange(None, None), False],
+            [_datetimerange_null(), False],
         ],
     )
     def test_normal(self, value, expected):
@@ -528,9 +678,9 @@ class TestDateTimeRange_is_time_inversion:
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), False],
+            [_datetimerange_normal(), False],
             [DateTimeRange(TEST_START_DATETIME, TEST_START_DATETIME), False],
-            [DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME), True],
+            [_datetimerange_inversion(), True],
         ],
     )
     def test_normal(self, value, expected):
@@ -547,9 +697,9 @@ class TestDateTimeRange_is_time_inversion:
     @pytest.mark.parametrize(
         ["value"],
         [
-            [DateTimeRange(None, None)],
-            [DateTimeRange(None, TEST_END_DATETIME)],
-            [DateTimeRange(TEST_START_DATETIME, None)],
+            [_datetimerange_null()],
+            [_datetimerange_null_start()],
+            [_datetimerange_null_end()],
         ],
     )
     def test_exception(self, value):
@@ -561,7 +711,7 @@ class TestDateTimeRange_validate_time_inversion:
     @pytest.mark.parametrize(
         ["value"],
         [
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)],
+            [_datetimerange_normal()],
             [DateTimeRange(TEST_START_DATETIME, TEST_START_DATETIME)],
         ],
     )
@@ -575,9 +725,9 @@ class TestDateTimeRange_validate_time_inversion:
     @pytest.mark.parametrize(
         ["value"],
         [
-            [DateTimeRange(None, None)],
-            [DateTimeRange(None, TEST_END_DATETIME)],
-            [DateTimeRange(TEST_START_DATETIME, None)],
+            [_datetimerange_null()],
+            [_datetimerange_null_start()],
+            [_datetimerange_null_end()],
         ],
     )
     def test_exception(self, value):
@@ -597,11 +747,12 @@ class TestDateTimeRange_is_valid_timerange:
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
-            [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME), True],
-            [DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME), False],
-            [DateTimeRange(TEST_START_DATETIME, None), False],
+            [_datetimerange_normal(), True],
+            [_datetimerange_inversion(), False],
+            [_datetimerange_null_end(), False],
             [DateTimeRange(None, TEST_START_DATETIME), False],
-            [DateTimeRange(None, None), False],
+            [_datetimerange_null(), False],
+            [DateTimeRange(datetime.min, datetime(2000, 1, 1)), False],
         ],
     )
     def test_normal(self, value, expected):
@@ -624,7 +775,7 @@ class TestDateTimeRange_range:
             ],
             [
                 DateTimeRange(datetime(2015, 3, 22, 0, 0, 0), datetime(2015, 3, 23, 0, 0, 0)),
-                relativedelta(hours=+6),
+                _RD_6H,
                 [
                     datetime(2015, 3, 22, 0, 0, 0),
                     datetime(2015, 3, 22, 6, 0, 0),
@@ -639,13 +790,13 @@ class TestDateTimeRange_range:
                 [datetime(2015, 3, 22, 0, 0, 0)],
             ],
             [
-                DateTimeRange("2015-01-01T00:00:00+0900", "2016-01-01T00:00:00+0900"),
-                relativedelta(months=+4),
+                DateTimeRange(datetime(2015, 1, 1, tzinfo=JST), datetime(2016, 1, 1, tzinfo=JST)),
+                _RD_4MO,
                 [
-                    parse("2015-01-01T00:00:00+0900"),
-                    parse("2015-05-01T00:00:00+0900"),
-                    parse("2015-09-01T00:00:00+0900"),
-                    parse("2016-01-01T00:00:00+0900"),
+                    datetime(2015, 1, 1, tzinfo=JST),
+                    datetime(2015, 5, 1, tzinfo=JST),
+                    datetime(2015, 9, 1, tzinfo=JST),
+                    datetime(2016, 1, 1, tzinfo=JST),
                 ],
             ],
             [
@@ -672,10 +823,7 @@ class TestDateTimeRange_range:
         ],
     )
     def test_normal(self, value, step, expected):
-        results = list(value.range(step))
-        assert len(results) == len(expected)
-        for value_item, expected_item in zip(results, expected):
-            assert value_item == expected_item
+        assert list(value.range(step)) == expected
 
     def test_normal_dst(self):
         dtr = DateTimeRange("2022-10-29 00:00:00+02:00", "2022-10-31 00:00:00+01:00")
@@ -686,9 +834,7 @@ class TestDateTimeRange_range:
             _normalize_datetime_value(datetime(2022, 10, 30, 0, 0, 0), timezone=timezone),
             _normalize_datetime_value(datetime(2022, 10, 31, 0, 0, 0), timezone=timezone),
         ]
-        assert len(results) == len(expected)
-        for value_item, expected_item in zip(results, expected):
-            assert value_item == expected_item
+        assert results == expected
 
     @pytest.mark.parametrize(
         ["value", "step", "expected"],
@@ -715,7 +861,7 @@ class TestDateTimeRange_range:
             ],
             [
                 DateTimeRange(datetime(2015, 3, 22, 0, 0, 0), datetime(2015, 3, 22, 0, 1, 0)),
-                timedelta(seconds=0),
+                _TD_ZERO,
                 ValueError,
             ],
             [
@@ -723,8 +869,8 @@ class TestDateTimeRange_range:
                 relativedelta(months=+0),
                 ValueError,
             ],
-            [None, relativedelta(months=+4), AttributeError],
-            [10, relativedelta(months=+4), AttributeError],
+            [None, _RD_4MO, AttributeError],
+            [10, _RD_4MO, AttributeError],
         ],
     )
     def test_exception(self, value, step, expected):
@@ -738,13 +884,13 @@ class TestDateTimeRange_is_intersection:
         ["lhs", "rhs", "expected"],
         [
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
+                _datetimerange_normal(),
                 True,
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T10:10:00+0900", "2015-03-22T10:20:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 False,
             ],
             [
@@ -753,18 +899,18 @@ class TestDateTimeRange_is_intersection:
                 False,
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T10:00:00+0900", "2015-03-22T10:20:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 True,
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:05:00+0900"),
-                DateTimeRange("2015-01-22T10:00:00+0900", "2015-03-22T10:20:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 True,
             ],
             [
-                DateTimeRange("2015-01-22T10:00:00+0900", "2015-03-22T10:20:00+0900"),
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:05:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
                 True,
             ],
             [
@@ -805,45 +951,20 @@ class TestDateTimeRange_is_intersection:
             ],
             [
                 # https://github.com/thombashi/DateTimeRange/issues/48
-                DateTimeRange("2015-03-22T10:00:00+0900", "2015-03-22T10:10:00+0900"),
-                DateTimeRange("2015-03-23T10:05:00+0900", "2015-03-23T10:15:00+0900"),
+                DateTimeRange(datetime(2015, 3, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 3, 23, 10, 5, tzinfo=JST), datetime(2015, 3, 23, 10, 15, tzinfo=JST)),
                 timedelta(seconds=1),
                 False,
             ],
         ],
     )
     def test_normal_w_intersection_threshold(self, lhs, rhs, threshold, expected):
-        lhs_org = deepcopy(lhs)
+        lhs_org = _snapshot(lhs)
 
         assert lhs.is_intersection(rhs, threshold) == expected
-        assert lhs == lhs_org
+        assert _snapshot(lhs) == lhs_org
 
-    @pytest.mark.parametrize(
-        ["lhs", "rhs", "expected"],
-        [
-            [DateTimeRange(None, None), DateTimeRange(None, None), TypeError],
-            [
-                DateTimeRange(None, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                TypeError,
-            ],
-            [
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                ValueError,
-            ],
-            [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(None, TEST_END_DATETIME),
-                TypeError,
-            ],
-            [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                ValueError,
-            ],
-        ],
-    )
+    @pytest.mark.parametrize(["lhs", "rhs", "expected"], _binary_exc_cases())
     def test_exception(self, lhs, rhs, expected):
         with pytest.raises(expected):
             lhs.is_intersection(rhs)
@@ -854,51 +975,51 @@ class TestDateTimeRange_subtract:
         ["lhs", "rhs", "expected"],
         [
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
+                _datetimerange_normal(),
                 [],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T10:30:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
                 [],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900"),
-                DateTimeRange("2015-01-22T10:40:00+0900", "2015-01-22T10:50:00+0900"),
-                [DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 40, tzinfo=JST), datetime(2015, 1, 22, 10, 50, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900"),
-                DateTimeRange("2015-01-22T09:55:00+0900", "2015-01-22T09:55:00+0900"),
-                [DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 55, tzinfo=JST), datetime(2015, 1, 22, 9, 55, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900"),
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                [DateTimeRange("2015-01-22T10:00:00+0900", "2015-01-22T10:30:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:30:00+0900"),
-                DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T10:00:00+0900"),
-                [DateTimeRange("2015-01-22T10:00:00+0900", "2015-01-22T10:30:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                [DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T09:50:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 9, 50, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:10:00+0900"),
-                [DateTimeRange("2015-01-22T09:30:00+0900", "2015-01-22T09:50:00+0900")],
+                DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 10, tzinfo=JST)),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 30, tzinfo=JST), datetime(2015, 1, 22, 9, 50, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T10:00:00+0900"),
-                DateTimeRange("2015-01-22T09:55:00+0900", "2015-01-22T09:56:00+0900"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 55, tzinfo=JST), datetime(2015, 1, 22, 9, 56, tzinfo=JST)),
                 [
-                    DateTimeRange("2015-01-22T09:50:00+0900", "2015-01-22T09:55:00+0900"),
-                    DateTimeRange("2015-01-22T09:56:00+0900", "2015-01-22T10:00:00+0900"),
+                    DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 9, 55, tzinfo=JST)),
+                    DateTimeRange(datetime(2015, 1, 22, 9, 56, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
                 ],
             ],
         ],
@@ -906,168 +1027,153 @@ class TestDateTimeRange_subtract:
     def test_normal(self, lhs, rhs, expected):
         assert lhs.subtract(rhs) == expected
 
-    @pytest.mark.parametrize(
-        ["lhs", "rhs", "expected"],
-        [
-            [DateTimeRange(None, None), DateTimeRange(None, None), TypeError],
-            [
-                DateTimeRange(None, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                TypeError,
-            ],
-            [
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                ValueError,
-            ],
-            [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(None, TEST_END_DATETIME),
-                TypeError,
-            ],
-            [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                ValueError,
-            ],
-        ],
-    )
+    @pytest.mark.parametrize(["lhs", "rhs", "expected"], _binary_exc_cases())
     def test_exception(self, lhs, rhs, expected):
         with pytest.raises(expected):
             lhs.subtract(rhs)
 
 
-class TestDateTimeRange_get_start_time_str:
+class TestDateTimeRange_get_time_str:
     @pytest.mark.parametrize(
-        ["time_format", "expected"],
+        ["which", "time_format", "expected"],
         [
-            [ISO_TIME_FORMAT, START_DATETIME_TEXT],
-            ["%Y/%m/%d %H:%M:%S%z", "2015/03/22 10:00:00+0900"],
+            ["start", ISO_TIME_FORMAT, START_DATETIME_TEXT],
+            ["start", "%Y/%m/%d %H:%M:%S%z", "2015/03/22 10:00:00+0900"],
+            ["end", ISO_TIME_FORMAT, END_DATETIME_TEXT],
+            ["end", "%Y/%m/%d %H:%M:%S%z", "2015/03/22 10:10:00+0900"],
         ],
     )
-    def test_normal(self, datetimerange_normal, time_format, expected):
-        datetimerange_normal.start_time_format = time_format
-        assert datetimerange_normal.get_start_time_str() == expected
+    def test_normal(self, datetimerange_normal, which, time_format, expected):
+        setattr(datetimerange_normal, f"{which}_time_format", time_format)
+        assert getattr(datetimerange_normal, f"get_{which}_time_str")() == expected
 
-    def test_abnormal_1(self, datetimerange_null):
-        assert datetimerange_null.get_start_time_str() == DateTimeRange.NOT_A_TIME_STR
+    @pytest.mark.parametrize("which", ["start", "end"])
+    def test_abnormal_1(self, which):
+        assert getattr(_datetimerange_null(), f"get_{which}_time_str")() == DateTimeRange.NOT_A_TIME_STR
 
-    def test_abnormal_2(self, datetimerange_normal):
-        datetimerange_normal.start_time_format = "aaa"
-        assert datetimerange_normal.get_start_time_str() == "aaa"
+    @pytest.mark.parametrize("which", ["start", "end"])
+    def test_abnormal_2(self, datetimerange_normal, which):
+        setattr(datetimerange_normal, f"{which}_time_format", "aaa")
+        assert getattr(datetimerange_normal, f"get_{which}_time_str")() == "aaa"
 
-    @pytest.mark.parametrize(["time_format", "expected"], [[None, TypeError]])
-    def test_exception(self, datetimerange_normal, time_format, expected):
-        datetimerange_normal.start_time_format = time_format
-        with pytest.raises(expected):
-            datetimerange_normal.get_start_time_str()
-
-
-class TestDateTimeRange_get_end_time_str:
     @pytest.mark.parametrize(
-        ["time_format", "expected"],
-        [[ISO_TIME_FORMAT, END_DATETIME_TEXT], ["%Y/%m/%d %H:%M:%S%z", "2015/03/22 10:10:00+0900"]],
+        ["which", "time_format", "expected"],
+        [
+            ["start", None, TypeError],
+            ["end", None, TypeError],
+        ],
     )
-    def test_normal(self, datetimerange_normal, time_format, expected):
-        datetimerange_normal.end_time_format = time_format
-        assert datetimerange_normal.get_end_time_str() == expected
-
-    def test_abnormal_1(self, datetimerange_null):
-        assert datetimerange_null.get_end_time_str() == DateTimeRange.NOT_A_TIME_STR
-
-    def test_abnormal_2(self, datetimerange_normal):
-        datetimerange_normal.end_time_format = "aaa"
-        assert datetimerange_normal.get_end_time_str() == "aaa"
-
-    @pytest.mark.parametrize(["time_format", "expected"], [[None, TypeError]])
-    def test_exception(self, datetimerange_normal, time_format, expected):
-        datetimerange_normal.end_time_format = time_format
+    def test_exception(self, datetimerange_normal, which, time_format, expected):
+        setattr(datetimerange_normal, f"{which}_time_format", time_format)
         with pytest.raises(expected):
-            datetimerange_normal.get_end_time_str()
+            getattr(datetimerange_normal, f"get_{which}_time_str")()
 
 
 class TestDateTimeRange_get_timedelta_second:
     def test_normal(self, datetimerange_normal):
-        assert datetimerange_normal.get_timedelta_second() == 600
+        assert datetimerange_normal.get_timedelta_second() == _TD_10M.total_seconds()
 
     def test_inversion(self, datetimerange_inversion):
-        assert datetimerange_inversion.get_timedelta_second() == -600
+        assert datetimerange_inversion.get_timedelta_second() == _TD_10M_NEG.total_seconds()
 
-    def test_null(self, datetimerange_null):
+    def test_null(self):
         with pytest.raises(TypeError):
-            datetimerange_null.get_timedelta_second()
+            _datetimerange_null().get_timedelta_second()
 
     def test_exception(self, datetimerange_null_start):
         with pytest.raises(TypeError):
             datetimerange_null_start.get_timedelta_second()
 
 
-class TestDateTimeRange_set_start_datetime:
+@pytest.mark.parametrize("which", ["start", "end"])
+class TestDateTimeRange_set_datetime:
     @pytest.mark.parametrize(
         ["value", "timezone", "expected"],
         [
             [START_DATETIME_TEXT, None, TEST_START_DATETIME],
             [TEST_START_DATETIME, None, TEST_START_DATETIME],
-            [1485685623, pytz.utc, pytz.utc.localize(datetime(2017, 1, 29, 10, 27, 3))],
-            ["1485685623", pytz.utc, pytz.utc.localize(datetime(2017, 1, 29, 10, 27, 3))],
+            [1485685623, pytz.utc, datetime(2017, 1, 29, 10, 27, 3, tzinfo=timezone.utc)],
+            ["1485685623", pytz.utc, datetime(2017, 1, 29, 10, 27, 3, tzinfo=timezone.utc)],
             [
                 1485685623,
-                pytz.timezone("Asia/Tokyo"),
-                pytz.timezone("Asia/Tokyo").localize(datetime(2017, 1, 29, 19, 27, 3)),
+                TZ_TOKYO,
+                datetime(2017, 1, 29, 19, 27, 3, tzinfo=JST),
             ],
             [None, None, None],
         ],
     )
-    def test_normal(self, value, timezone, expected):
+    def test_normal(self, which, value, timezone, expected):
         dtr = DateTimeRange(TEST_END_DATETIME, TEST_END_DATETIME)
-        dtr.set_start_datetime(value, timezone=timezone)
+        getattr(dtr, f"set_{which}_datetime")(value, timezone=timezone)
 
-        assert dtr.start_datetime == expected
+        assert getattr(dtr, f"{which}_datetime") == expected
 
     @pytest.mark.parametrize(
-        ["value", "expected"],
+        ["value", "expected_naive", "expected_utcoffset"],
         [
-            ["invalid time string", ValueError],
-            ["3.3.5", ValueError],
-        ],
-    )
-    def test_null_start(self, datetimerange_null_start, value, expected):
-        with pytest.raises(expected):
-            datetimerange_null_start.set_start_datetime(value)
-
-
-class TestDateTimeRange_set_end_datetime:
-    @pytest.mark.parametrize(
-        ["value", "timezone", "expected"],
-        [
-            [START_DATETIME_TEXT, None, TEST_START_DATETIME],
-            [TEST_START_DATETIME, None, TEST_START_DATETIME],
-            [1485685623, pytz.utc, pytz.utc.localize(datetime(2017, 1, 29, 10, 27, 3))],
-            ["1485685623", pytz.utc, pytz.utc.localize(datetime(2017, 1, 29, 10, 27, 3))],
+            ["2015-03-22 10:00:00", datetime(2015, 3, 22, 10, 0, 0), None],
+            ["2015-03-22T10:00:00.5+09:00", datetime(2015, 3, 22, 10, 0, 0, 500000), timedelta(hours=9)],
             [
-                1485685623,
-                pytz.timezone("Asia/Tokyo"),
-                pytz.timezone("Asia/Tokyo").localize(datetime(2017, 1, 29, 19, 27, 3)),
+                "2015-03-22T10:00:00.1234567+0530",
+                datetime(2015, 3, 22, 10, 0, 0, 123456),
+                timedelta(hours=5, minutes=30),
             ],
-            [None, None, None],
+            # offsets converted to DST-aware timezones
+            ["2015-03-22T10:00:00-0500", datetime(2015, 3, 22, 10, 0, 0), timedelta(hours=-4)],
+            ["2015-01-22T10:00:00-0500", datetime(2015, 1, 22, 10, 0, 0), timedelta(hours=-5)],
         ],
     )
-    def test_normal(self, value, timezone, expected):
+    def test_normal_iso(self, which, value, expected_naive, expected_utcoffset):
         dtr = DateTimeRange(TEST_END_DATETIME, TEST_END_DATETIME)
-        dtr.set_end_datetime(value, timezone=timezone)
+        getattr(dtr, f"set_{which}_datetime")(value)
 
-        assert dtr.end_datetime == expected
+        result = getattr(dtr, f"{which}_datetime")
+        assert result.replace(tzinfo=None) == expected_naive
+        assert result.utcoffset() == expected_utcoffset
 
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
             ["invalid time string", ValueError],
             ["3.3.5", ValueError],
+            ["2015-02-29T10:00:00+0900", ValueError],
+            ["2015-03-22T10:00:00+2400", ValueError],
+            ["2015-03-22T10:00:00+9959", ValueError],
         ],
     )
-    def test_null_start(self, datetimerange_null_start, value, expected):
+    def test_null_start(self, datetimerange_null_start, which, value, expected):
         with pytest.raises(expected):
-            datetimerange_null_start.set_end_datetime(value)
+            getattr(datetimerange_null_start, f"set_{which}_datetime")(value)
+
+
+def _format_utc_offset(offset_min: int) -> str:
+    sign = "-" if offset_min < 0 else "+"
+    return "{}{:02d}:{:02d}".format(sign, *divmod(abs(offset_min), 60))
+
+
+_TYPEPY_DST_OFFSETS = sorted(
+    offset_sec // 60 for offset_sec in typepy.converter.DateTimeConverter._DateTimeConverter__COMMON_DST_TIMEZONE_TABLE
+)
+
+
+class TestDateTimeRange_iso_fast_path:
+    def test_fast_path_offsets_not_in_typepy_dst_table(self):
+        assert _TYPEPY_DST_OFFSETS
+        assert _FAST_PATH_UTC_OFFSETS.isdisjoint(_TYPEPY_DST_OFFSETS)
+
+    @pytest.mark.parametrize(
+        ["offset_min"],
+        [[offset_min] for offset_min in sorted(_FAST_PATH_UTC_OFFSETS | {0, 2 * 60, -5 * 60, *_TYPEPY_DST_OFFSETS})],
+    )
+    @pytest.mark.parametrize(["date_text"], [["2015-01-22T10:00:00"], ["2015-07-22T10:00:00.123"]])
+    def test_normal_same_as_typepy(self, date_text, offset_min):
+        value = date_text + _format_utc_offset(offset_min)
+        expected = typepy.DateTime(value, strict_level=typepy.StrictLevel.MIN).convert()
+        actual = _normalize_datetime_value(value, None)
+
+        assert actual == expected
+        assert actual.utcoffset() == expected.utcoffset()
+        assert type(actual.tzinfo) is type(expected.tzinfo)
 
 
 class TestDateTimeRange_set_time_range:
@@ -1077,9 +1183,9 @@ class TestDateTimeRange_set_time_range:
             [
                 START_DATETIME_TEXT,
                 END_DATETIME_TEXT,
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
             ],
-            [None, None, DateTimeRange(None, None)],
+            [None, None, _datetimerange_null()],
         ],
     )
     def test_normal(self, start, end, expected):
@@ -1093,16 +1199,16 @@ class TestDateTimeRange_set_time_range:
         dtr_utc_rhs.set_time_range(TEST_START_DATETIME, TEST_END_DATETIME, timezone=pytz.UTC)
         assert dtr_utc_lhs == dtr_utc_rhs
 
-        dtr_tokyo_lhs = DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME, timezone=pytz.timezone("Asia/Tokyo"))
+        dtr_tokyo_lhs = DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME, timezone=TZ_TOKYO)
         dtr_tokyo_rhs = DateTimeRange()
-        dtr_tokyo_rhs.set_time_range(TEST_START_DATETIME, TEST_END_DATETIME, timezone=pytz.timezone("Asia/Tokyo"))
+        dtr_tokyo_rhs.set_time_range(TEST_START_DATETIME, TEST_END_DATETIME, timezone=TZ_TOKYO)
         assert dtr_tokyo_lhs == dtr_tokyo_rhs
 
         assert dtr_utc_lhs == dtr_tokyo_lhs
 
     def test_normal_replace_timezone(self):
         dtr_lhs = DateTimeRange(START_DATETIME_TEXT, START_DATETIME_TEXT, timezone=pytz.UTC)
-        dtr_rhs = DateTimeRange(START_DATETIME_TEXT, START_DATETIME_TEXT, timezone=pytz.timezone("Asia/Tokyo"))
+        dtr_rhs = DateTimeRange(START_DATETIME_TEXT, START_DATETIME_TEXT, timezone=TZ_TOKYO)
         assert dtr_lhs != dtr_rhs
 
     @pytest.mark.parametrize(
@@ -1124,182 +1230,234 @@ class TestDateTimeRange_intersection:
         ["lhs", "rhs", "expected"],
         [
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
+                _datetimerange_normal(),
+                _datetimerange_normal(),
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:10:00 JST", "2015-03-22T10:20:00 JST"),
-                DateTimeRange(None, None),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 10, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                _datetimerange_null(),
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:00:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:05:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
             ],
             [
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:05:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
             ],
             [
-                DateTimeRange("2014-01-22T10:00:00 JST", "2016-03-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
+                DateTimeRange(datetime(2014, 1, 22, 10, 0, tzinfo=JST), datetime(2016, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
             ],
             [
-                DateTimeRange("2015-01-12T10:00:00 JST", "2015-02-22T10:10:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:10:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-02-22T10:10:00 JST"),
+                DateTimeRange(datetime(2015, 1, 12, 10, 0, tzinfo=JST), datetime(2015, 2, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 10, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 2, 22, 10, 10, tzinfo=JST)),
             ],
         ],
     )
     def test_normal(self, lhs, rhs, expected):
-        lhs_org = deepcopy(lhs)
+        lhs_org = _snapshot(lhs)
 
         assert lhs.intersection(rhs) == expected
-        assert lhs == lhs_org
+        assert _snapshot(lhs) == lhs_org
 
     @pytest.mark.parametrize(
         ["lhs", "rhs", "threshold", "expected"],
         [
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 timedelta(seconds=0),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:00:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 timedelta(seconds=1),
-                DateTimeRange(None, None),
+                _datetimerange_null(),
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:01 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, 1, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
                 timedelta(seconds=1),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:00:01 JST"),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 0, 1, tzinfo=JST)),
             ],
         ],
     )
     def test_normal_w_intersection_threshold(self, lhs, rhs, threshold, expected):
-        lhs_org = deepcopy(lhs)
+        lhs_org = _snapshot(lhs)
 
         assert lhs.intersection(rhs, threshold) == expected
-        assert lhs == lhs_org
+        assert _snapshot(lhs) == lhs_org
+
+    @pytest.mark.parametrize(["lhs_span", "rhs_span"], _SWEEP_CASES)
+    def test_normal_sweep(self, lhs_span, rhs_span):
+        lhs = DateTimeRange(_to_dt(lhs_span[0]), _to_dt(lhs_span[1]))
+        rhs = DateTimeRange(_to_dt(rhs_span[0]), _to_dt(rhs_span[1]))
+        start = max(lhs_span[0], rhs_span[0])
+        end = min(lhs_span[1], rhs_span[1])
+        expected = DateTimeRange(_to_dt(start), _to_dt(end)) if start <= end else DateTimeRange()
+
+        assert lhs.intersection(rhs) == expected
+        assert rhs.intersection(lhs) == expected
+
+    @pytest.mark.parametrize(["lhs", "rhs", "expected"], _binary_exc_cases())
+    def test_exception(self, lhs, rhs, expected):
+        with pytest.raises(expected):
+            lhs.intersection(rhs)
+
 
+class TestDateTimeRange_encompass:
     @pytest.mark.parametrize(
         ["lhs", "rhs", "expected"],
         [
-            [DateTimeRange(None, None), DateTimeRange(None, None), TypeError],
             [
-                DateTimeRange(None, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                TypeError,
+                _datetimerange_normal(),
+                _datetimerange_normal(),
+                _datetimerange_normal(),
             ],
             [
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                ValueError,
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 10, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(None, TEST_END_DATETIME),
-                TypeError,
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                ValueError,
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
+            ],
+            [
+                DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 5, tzinfo=JST)),
+                DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 3, 22, 10, 20, tzinfo=JST)),
             ],
         ],
     )
+    def test_normal(self, lhs, rhs, expected):
+        lhs_org = _snapshot(lhs)
+
+        assert lhs.encompass(rhs) == expected
+        assert _snapshot(lhs) == lhs_org
+
+    @pytest.mark.parametrize(["lhs_span", "rhs_span"], _SWEEP_CASES)
+    def test_normal_sweep(self, lhs_span, rhs_span):
+        lhs = DateTimeRange(_to_dt(lhs_span[0]), _to_dt(lhs_span[1]))
+        rhs = DateTimeRange(_to_dt(rhs_span[0]), _to_dt(rhs_span[1]))
+        expected = DateTimeRange(_to_dt(min(lhs_span[0], rhs_span[0])), _to_dt(max(lhs_span[1], rhs_span[1])))
+
+        assert lhs.encompass(rhs) == expected
+        assert rhs.encompass(lhs) == expected
+
+    @pytest.mark.parametrize(["lhs", "rhs", "expected"], _binary_exc_cases())
     def test_exception(self, lhs, rhs, expected):
         with pytest.raises(expected):
-            lhs.intersection(rhs)
+            lhs.encompass(rhs)
 
 
-class TestDateTimeRange_encompass:
+class TestDateTimeRange_intersect_many:
     @pytest.mark.parametrize(
         ["lhs", "rhs", "expected"],
         [
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-            ],
-            [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:10:00 JST", "2015-01-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:20:00 JST"),
-            ],
-            [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:00:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:20:00 JST"),
+                [
+                    DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 10, tzinfo=JST)),
+                    DateTimeRange(datetime(2015, 1, 22, 10, 20, tzinfo=JST), datetime(2015, 1, 22, 10, 30, tzinfo=JST)),
+                ],
+                [DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 25, tzinfo=JST))],
+                [
+                    DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 10, tzinfo=JST)),
+                    DateTimeRange(datetime(2015, 1, 22, 10, 20, tzinfo=JST), datetime(2015, 1, 22, 10, 25, tzinfo=JST)),
+                ],
             ],
             [
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-01-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:20:00 JST"),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST))],
+                [
+                    DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 10, tzinfo=JST)),
+                    DateTimeRange(datetime(2015, 1, 22, 10, 10, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST)),
+                ],
+                [DateTimeRange(datetime(2015, 1, 22, 10, 0, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST))],
             ],
             [
-                DateTimeRange("2015-01-22T10:00:00 JST", "2015-03-22T10:20:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-01-22T10:05:00 JST"),
-                DateTimeRange("2015-01-22T09:50:00 JST", "2015-03-22T10:20:00 JST"),
+                [DateTimeRange(datetime(2015, 1, 22, 9, 50, tzinfo=JST), datetime(2015, 1, 22, 10, 0, tzinfo=JST))],
+                [DateTimeRange(datetime(2015, 1, 22, 10, 10, tzinfo=JST), datetime(2015, 1, 22, 10, 20, tzinfo=JST))],
+                [],
             ],
+            [[], [_datetimerange_normal()], []],
         ],
     )
     def test_normal(self, lhs, rhs, expected):
-        lhs_org = deepcopy(lhs)
+        assert DateTimeRange.intersect_many(lhs, rhs) == expected
 
-        assert lhs.encompass(rhs) == expected
-        assert lhs == lhs_org
+    def test_normal_pairwise(self):
+        base = datetime(2015, 1, 22, 10, 0, 0)
+        lhs = [DateTimeRange(base + timedelta(minutes=i * 7), base + timedelta(minutes=i * 7 + 20)) for i in range(10)]
+        rhs = [DateTimeRange(base + timedelta(minutes=i * 11), base + timedelta(minutes=i * 11 + 5)) for i in range(8)]
+        for dtr in lhs:
+            dtr.start_time_format = "%H:%M"
+
+        expected = []
+        for lhs_item in lhs:
+            for rhs_item in rhs:
+                intersection = lhs_item.intersection(rhs_item)
+                if intersection.is_set():
+                    expected.append(intersection)
+
+        results = DateTimeRange.intersect_many(lhs, rhs)
+
+        def to_key(dtr):
+            return (dtr.start_datetime, dtr.end_datetime)
+
+        assert sorted(map(to_key, results)) == sorted(map(to_key, expected))
+        assert all(dtr.start_time_format == "%H:%M" for dtr in results)
+        assert [dtr.start_datetime for dtr in results] == sorted(dtr.start_datetime for dtr in results)
 
     @pytest.mark.parametrize(
         ["lhs", "rhs", "expected"],
         [
-            [DateTimeRange(None, None), DateTimeRange(None, None), TypeError],
-            [
-                DateTimeRange(None, TEST_END_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                TypeError,
-            ],
-            [
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                ValueError,
-            ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(None, TEST_END_DATETIME),
+                [_datetimerange_null_start()],
+                [_datetimerange_normal()],
                 TypeError,
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                DateTimeRange(TEST_END_DATETIME, TEST_START_DATETIME),
+                [_datetimerange_normal()],
+                [_datetimerange_inversion()],
                 ValueError,
             ],
         ],
     )
     def test_exception(self, lhs, rhs, expected):
         with pytest.raises(expected):
-            lhs.encompass(rhs)
+            DateTimeRange.intersect_many(lhs, rhs)
 
 
 class TestDateTimeRange_truncate:
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
-            [0, DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)],
-            [10, DateTimeRange("2015-03-22 10:00:30" + TIMEZONE, "2015-03-22 10:09:30" + TIMEZONE)],
+            [0, _datetimerange_normal()],
+            [
+                10,
+                DateTimeRange(
+                    datetime(2015, 3, 22, 10, 0, 30, tzinfo=JST), datetime(2015, 3, 22, 10, 9, 30, tzinfo=JST)
+                ),
+            ],
         ],
     )
     def test_normal(self, datetimerange_normal, value, expected):
@@ -1322,33 +1480,45 @@ class TestDateTimeRange_split:
         ["dtr", "separator", "expected"],
         [
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                "2015-03-22 10:05:00" + TIMEZONE,
+                _datetimerange_normal(),
+                "2015-03-22 10:05:00+0900",
                 [
-                    DateTimeRange(TEST_START_DATETIME, "2015-03-22 10:05:00" + TIMEZONE),
-                    DateTimeRange("2015-03-22 10:05:00" + TIMEZONE, TEST_END_DATETIME),
+                    DateTimeRange(TEST_START_DATETIME, datetime(2015, 3, 22, 10, 5, tzinfo=JST)),
+                    DateTimeRange(datetime(2015, 3, 22, 10, 5, tzinfo=JST), TEST_END_DATETIME),
                 ],
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
-                "2015-03-22 09:59:59" + TIMEZONE,
-                [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)],
+                _datetimerange_normal(),
+                "2015-03-22 09:59:59+0900",
+                [_datetimerange_normal()],
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
                 TEST_START_DATETIME,
-                [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)],
+                [_datetimerange_normal()],
             ],
             [
-                DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME),
+                _datetimerange_normal(),
                 END_DATETIME_TEXT,
-                [DateTimeRange(TEST_START_DATETIME, TEST_END_DATETIME)],
+                [_datetimerange_normal()],
             ],
         ],
     )
     def test_normal(self, dtr, separator, expected):
         assert dtr.split(separator) == expected
 
+    @pytest.mark.parametrize(
+        ["dtr", "separator", "expected"],
+        [
+            [_datetimerange_normal(), None, TypeError],
+            [_datetimerange_normal(), "invalid time string", ValueError],
+            [_datetimerange_null(), END_DATETIME_TEXT, TypeError],
+        ],
+    )
+    def test_exception(self, dtr, separator, expected):
+        with pytest.raises(expected):
+            dtr.split(separator)
+
 
 class TestDateTimeRange_from_range_text:
     @pytest.mark.parametrize(
@@ -1369,6 +1539,11 @@ class TestDateTimeRange_from_range_text:
                 r"\s+\-\s+",
                 DateTimeRange(START_DATETIME_TEXT, END_DATETIME_TEXT),
             ],
+            [
+                f"{START_DATETIME_TEXT}\t-\t{END_DATETIME_TEXT}",
+                r"\s+\-\s+",
+                DateTimeRange(START_DATETIME_TEXT, END_DATETIME_TEXT),
+            ],
         ],
     )
     def test_normal(self, value, separator, expected):
@@ -1377,6 +1552,18 @@ class TestDateTimeRange_from_range_text:
         assert dtr.start_time_format == r"%Y-%m-%dT%H:%M:%S%z"
         assert dtr.end_time_format == r"%Y-%m-%dT%H:%M:%S%z"
 
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            [START_DATETIME_TEXT],
+            [f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT} - {END_DATETIME_TEXT}"],
+            [f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT}\t-\t{END_DATETIME_TEXT}"],
+        ],
+    )
+    def test_exception(self, value):
+        with pytest.raises(ValueError):
+            DateTimeRange.from_range_text(value)
+
     def test_normal_tz(self):
         dtr = DateTimeRange.from_range_text(f"{START_DATETIME_TEXT} - {END_DATETIME_TEXT}", timezone=pytz.utc)
         assert dtr.timezone == pytz.utc